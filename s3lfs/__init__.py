@@ -1,4 +1,3 @@
-# s3lfs/__init__.py
 """
 s3lfs - A Python-based version control system for large assets using Amazon S3.
 
@@ -7,8 +6,21 @@ with support for file tracking, parallel operations, encryption, and
 automatic cleanup of unused assets.
 """
 
+import importlib
+from typing import TYPE_CHECKING
+
 from . import metrics
-from .core import S3LFS
+
+if TYPE_CHECKING:
+    from .core import S3LFS
 
 __version__ = "0.1.0"
 __all__ = ["S3LFS", "metrics", "__version__"]
+
+
+def __getattr__(name):
+    # S3LFS lives in s3lfs.core, which imports boto3. Resolve it on first access so
+    # importing the package (e.g. for the CLI entry point) stays cheap.
+    if name == "S3LFS":
+        return importlib.import_module(".core", __name__).S3LFS
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
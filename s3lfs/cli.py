@@ -1,15 +1,54 @@
+import functools
+import importlib
 import json
+import re
 from pathlib import Path
 
 import click
 import yaml
 
 from s3lfs import metrics
-from s3lfs.core import S3LFS
 from s3lfs.path_resolver import PathResolver
 from s3lfs.utils import find_git_root
 
 
+@functools.lru_cache(maxsize=None)
+def _get_s3lfs_class():
+    """
+    Import S3LFS on first use.
+
+    s3lfs.core pulls in boto3/botocore, which dominates CLI start-up time. Deferring
+    the import means `--help`, usage errors and commands that bail out early never
+    pay for it.
+    """
+    return importlib.import_module("s3lfs.core").S3LFS
+
+
+def _make_s3lfs(**kwargs):
+    """
+    Construct an S3LFS instance, importing the core module lazily.
+
+    Instances are memoized in the click context object by their constructor
+    arguments. A program that drives the CLI in-process and passes the same
+    ``obj`` dict to every ``cli.main(..., obj=shared, standalone_mode=False)``
+    call therefore reuses one instance (and its boto3 clients) across commands.
+    A reused instance re-reads the manifest so it never acts on a stale copy.
+    """
+    ctx = click.get_current_context(silent=True)
+    if ctx is None or not isinstance(ctx.obj, dict):
+        return _get_s3lfs_class()(**kwargs)
+
+    instances = ctx.obj.setdefault("s3lfs", {})
+    key = tuple(sorted(kwargs.items()))
+    s3lfs = instances.get(key)
+    if s3lfs is None:
+        s3lfs = instances[key] = _get_s3lfs_class()(**kwargs)
+    else:
+        with s3lfs._lock_context():
+            s3lfs.load_manifest()
+    return s3lfs
+
+
 def _setup_s3lfs_command(cli_path=None, require_manifest=True):
     """
     Common setup for S3LFS CLI commands.
@@ -73,19 +112,132 @@ def get_manifest_path(git_root):
     return yaml_manifest
 
 
+class ByteSize(click.ParamType):
+    """Click parameter type for byte counts such as 1048576, 16MB or 64MiB."""
+
+    name = "size"
+
+    def convert(self, value, param, ctx):
+        if isinstance(value, int):
+            return value
+        match = re.fullmatch(r"\s*(\d+)\s*([KMGT]?)(?:i?B)?\s*", value, re.IGNORECASE)
+        if not match:
+            self.fail(f"{value!r} is not a valid size", param, ctx)
+        number, unit = match.groups()
+        return int(number) * 1024 ** " KMGT".index(unit.upper() or " ")
+
+
+_S3_OPTIONS = (
+    click.option(
+        "--no-sign-request",
+        is_flag=True,
+        envvar="S3LFS_NO_SIGN_REQUEST",
+        help="Use unsigned S3 requests",
+    ),
+    click.option(
+        "--use-acceleration",
+        is_flag=True,
+        envvar="S3LFS_USE_ACCELERATION",
+        help="Enable S3 Transfer Acceleration",
+    ),
+)
+
+
+def s3_options(f):
+    """Apply the S3 connection options shared by every S3-backed command."""
+    for option in reversed(_S3_OPTIONS):
+        f = option(f)
+    return f
+
+
+_TRANSFER_OPTIONS = (
+    click.option(
+        "--concurrency",
+        type=click.IntRange(min=1),
+        default=None,
+        help="Number of files hashed and transferred in parallel",
+    ),
+    click.option(
+        "--max-concurrency",
+        type=click.IntRange(min=1),
+        default=None,
+        help="Number of parallel part transfers per file",
+    ),
+    click.option(
+        "--multipart-chunksize",
+        type=ByteSize(),
+        default=None,
+        help="Part size for multipart transfers (e.g. 16MB)",
+    ),
+)
+
+
+def transfer_options(f):
+    """Apply the multipart transfer tuning options shared by track and checkout."""
+    for option in reversed(_TRANSFER_OPTIONS):
+        f = option(f)
+    return f
+
+
+manifest_cache_option = click.option(
+    "--manifest-cache",
+    type=click.Path(dir_okay=False),
+    envvar="S3LFS_MANIFEST_CACHE",
+    default=None,
+    help="Reuse a pickled copy of the parsed manifest stored at this path",
+)
+
+
+local_hash_option = click.option(
+    "--local-hash",
+    type=click.Choice(["sha256", "blake3"]),
+    default="sha256",
+    show_default=True,
+    envvar="S3LFS_LOCAL_HASH",
+    help="Hash used by the local hash cache to spot files whose content is "
+    "unchanged despite new metadata (blake3 needs s3lfs[blake3])",
+)
+
+
+dry_run_option = click.option(
+    "--dry-run",
+    is_flag=True,
+    help="Show what would change using only the manifest and local files; "
+    "nothing is uploaded or deleted",
+)
+
+
+metrics_option = click.option(
+    "--metrics",
+    "enable_metrics_flag",
+    is_flag=True,
+    help="Enable parallelism metrics collection",
+)
+
+
+def _transfer_kwargs(concurrency, max_concurrency, multipart_chunksize):
+    """Build S3LFS keyword arguments for the transfer options that were given."""
+    kwargs = {}
+    if concurrency is not None:
+        kwargs["thread_pool_size"] = concurrency
+    if max_concurrency is not None:
+        kwargs["max_concurrency"] = max_concurrency
+    if multipart_chunksize is not None:
+        kwargs["multipart_chunksize"] = multipart_chunksize
+    return kwargs
+
+
 @click.group()
-def cli():
+@click.pass_context
+def cli(ctx):
     """S3-based asset versioning CLI tool."""
-    pass
+    ctx.ensure_object(dict)
 
 
 @click.command()
-@click.argument("bucket", required=True)
-@click.argument("prefix", required=True)
-@click.option("--no-sign-request", is_flag=True, help="Use unsigned S3 requests")
-@click.option(
-    "--use-acceleration", is_flag=True, help="Enable S3 Transfer Acceleration"
-)
+@click.argument("bucket", required=True, envvar="S3LFS_BUCKET")
+@click.argument("prefix", required=True, envvar="S3LFS_PREFIX")
+@s3_options
 def init(bucket, prefix, no_sign_request, use_acceleration):
     """Initialize S3LFS with a bucket and repo prefix"""
     # Find git root
@@ -101,7 +253,7 @@ def init(bucket, prefix, no_sign_request, use_acceleration):
         return
 
     try:
-        s3lfs = S3LFS(
+        s3lfs = _make_s3lfs(
             bucket_name=bucket,
             repo_prefix=prefix,
             no_sign_request=no_sign_request,
@@ -114,12 +266,9 @@ def init(bucket, prefix, no_sign_request, use_acceleration):
         return
 
 
-@cli.command()
+@click.command()
 @click.argument("path", required=False)
-@click.option("--no-sign-request", is_flag=True, help="Use unsigned S3 requests")
-@click.option(
-    "--use-acceleration", is_flag=True, help="Enable S3 Transfer Acceleration"
-)
+@s3_options
 @click.option(
     "--verbose", is_flag=True, help="Show detailed progress and upload information"
 )
@@ -127,13 +276,30 @@ def init(bucket, prefix, no_sign_request, use_acceleration):
     "--modified", is_flag=True, help="Track only modified files from manifest"
 )
 @click.option(
-    "--metrics",
-    "enable_metrics_flag",
+    "--no-git-fastpath",
     is_flag=True,
-    help="Enable parallelism metrics collection",
+    help="With --modified, re-check every tracked file instead of trusting "
+    "git for files it reports as unchanged since HEAD",
 )
+@dry_run_option
+@transfer_options
+@manifest_cache_option
+@local_hash_option
+@metrics_option
 def track(
-    path, no_sign_request, use_acceleration, verbose, modified, enable_metrics_flag
+    path,
+    no_sign_request,
+    use_acceleration,
+    verbose,
+    modified,
+    no_git_fastpath,
+    dry_run,
+    concurrency,
+    max_concurrency,
+    multipart_chunksize,
+    manifest_cache,
+    local_hash,
+    enable_metrics_flag,
 ):
     """Track files, directories, or globs. Use --modified to track only changed files."""
     # Enable metrics if requested
@@ -149,32 +315,38 @@ def track(
         git_root, manifest_path, path_resolver = _setup_s3lfs_command()
         manifest_key = None
 
-    s3lfs = S3LFS(
+    s3lfs = _make_s3lfs(
         no_sign_request=no_sign_request,
         manifest_file=str(manifest_path),
         use_acceleration=use_acceleration,
+        manifest_cache=manifest_cache,
+        local_hash=local_hash,
+        **_transfer_kwargs(concurrency, max_concurrency, multipart_chunksize),
     )
 
     if modified:
         # Track only modified files using cached version for better performance
-        s3lfs.track_modified_files_cached(silence=not verbose)
+        s3lfs.track_modified_files_cached(
+            silence=not verbose, git_fastpath=not no_git_fastpath, dry_run=dry_run
+        )
     elif manifest_key:
         # FILESYSTEM GLOB: Find files on disk and upload them
         # The manifest_key is converted to a filesystem path, then glob is applied
         s3lfs.track(
-            manifest_key, silence=not verbose, interleaved=True, use_cache=False
+            manifest_key,
+            silence=not verbose,
+            interleaved=True,
+            use_cache=False,
+            dry_run=dry_run,
         )
     else:
         click.echo("Error: Must provide either a path or use --modified flag")
         raise click.Abort()
 
 
-@cli.command()
+@click.command()
 @click.argument("path", required=False)
-@click.option("--no-sign-request", is_flag=True, help="Use unsigned S3 requests")
-@click.option(
-    "--use-acceleration", is_flag=True, help="Enable S3 Transfer Acceleration"
-)
+@s3_options
 @click.option(
     "--verbose",
     is_flag=True,
@@ -182,13 +354,28 @@ def track(
 )
 @click.option("--all", is_flag=True, help="Checkout all files from manifest")
 @click.option(
-    "--metrics",
-    "enable_metrics_flag",
+    "--async",
+    "use_async",
     is_flag=True,
-    help="Enable parallelism metrics collection",
+    help="With --all, download using a single asyncio event loop",
 )
+@transfer_options
+@manifest_cache_option
+@local_hash_option
+@metrics_option
 def checkout(
-    path, no_sign_request, use_acceleration, verbose, all, enable_metrics_flag
+    path,
+    no_sign_request,
+    use_acceleration,
+    verbose,
+    all,
+    use_async,
+    concurrency,
+    max_concurrency,
+    multipart_chunksize,
+    manifest_cache,
+    local_hash,
+    enable_metrics_flag,
 ):
     """Checkout files, directories, or globs. Use --all to checkout all tracked files."""
     # Enable metrics if requested
@@ -204,13 +391,22 @@ def checkout(
         git_root, manifest_path, path_resolver = _setup_s3lfs_command()
         manifest_key = None
 
-    s3lfs = S3LFS(
+    s3lfs = _make_s3lfs(
         no_sign_request=no_sign_request,
         manifest_file=str(manifest_path),
         use_acceleration=use_acceleration,
+        manifest_cache=manifest_cache,
+        local_hash=local_hash,
+        **_transfer_kwargs(concurrency, max_concurrency, multipart_chunksize),
     )
 
-    if all:
+    if all and use_async:
+        # Download all files from manifest on an asyncio event loop. asyncio is
+        # imported here because it costs about as much start-up time as click.
+        import asyncio
+
+        asyncio.run(s3lfs.parallel_download_all_async(silence=not verbose))
+    elif all:
         # Download all files from manifest
         s3lfs.parallel_download_all(silence=not verbose)
     elif manifest_key:
@@ -222,19 +418,25 @@ def checkout(
         raise click.Abort()
 
 
-@cli.command()
+@click.command()
 @click.argument("path", required=False)
-@click.option("--no-sign-request", is_flag=True, help="Use unsigned S3 requests")
-@click.option(
-    "--use-acceleration", is_flag=True, help="Enable S3 Transfer Acceleration"
-)
+@s3_options
 @click.option(
     "--verbose",
     is_flag=True,
     help="Show detailed information including file sizes and hashes",
 )
 @click.option("--all", is_flag=True, help="List all tracked files from manifest")
-def ls(path, no_sign_request, use_acceleration, verbose, all, git_finder_func=None):
+@manifest_cache_option
+def ls(
+    path,
+    no_sign_request,
+    use_acceleration,
+    verbose,
+    all,
+    manifest_cache=None,
+    git_finder_func=None,
+):
     """List tracked files, directories, or globs. If no path is provided, lists all tracked files."""
     # Common setup: find git root, check manifest, resolve path
     # Note: git_finder_func is for testing purposes only
@@ -270,10 +472,11 @@ def ls(path, no_sign_request, use_acceleration, verbose, all, git_finder_func=No
     except ValueError:
         relative_cwd = Path(".")
 
-    s3lfs = S3LFS(
+    s3lfs = _make_s3lfs(
         no_sign_request=no_sign_request,
         manifest_file=str(manifest_path),
         use_acceleration=use_acceleration,
+        manifest_cache=manifest_cache,
     )
 
     if all or not manifest_key:
@@ -295,45 +498,52 @@ def ls(path, no_sign_request, use_acceleration, verbose, all, git_finder_func=No
 @click.command()
 @click.argument("path", required=True)
 @click.option("--purge-from-s3", is_flag=True, help="Purge file in S3 immediately")
-@click.option("--no-sign-request", is_flag=True, help="Use unsigned S3 requests")
-@click.option(
-    "--use-acceleration", is_flag=True, help="Enable S3 Transfer Acceleration"
-)
-def remove(path, purge_from_s3, no_sign_request, use_acceleration):
+@dry_run_option
+@s3_options
+def remove(path, purge_from_s3, dry_run, no_sign_request, use_acceleration):
     """Remove files or directories from tracking. Supports glob patterns."""
     # Common setup: find git root, check manifest, resolve path
     git_root, manifest_path, path_resolver, manifest_key = _setup_s3lfs_command(
         cli_path=path
     )
 
-    versioner = S3LFS(
+    versioner = _make_s3lfs(
         no_sign_request=no_sign_request,
         manifest_file=str(manifest_path),
         use_acceleration=use_acceleration,
     )
 
-    # Check if this is a single file (no glob, not a directory)
+    # Check if this is a single tracked file. The manifest decides, not the local
+    # filesystem: tracked files need not be checked out, and a string lookup saves
+    # a stat per invocation.
     has_glob = "*" in manifest_key or "?" in manifest_key or "[" in manifest_key
-    filesystem_path = path_resolver.to_filesystem_path(manifest_key)
-    is_single_file = not has_glob and filesystem_path.is_file()
+    is_single_file = not has_glob and manifest_key in versioner.manifest["files"]
 
     if is_single_file:
         # Optimize single file removal
-        versioner.remove_file(manifest_key, keep_in_s3=not purge_from_s3)
+        versioner.remove_file(
+            manifest_key, keep_in_s3=not purge_from_s3, dry_run=dry_run
+        )
     else:
         # MANIFEST GLOB: Find files in manifest and remove them
         # The manifest_key is matched against manifest entries
         # Note: This is manifest-only; files on disk are not affected
-        versioner.remove_subtree(manifest_key, keep_in_s3=not purge_from_s3)
+        versioner.remove_subtree(
+            manifest_key, keep_in_s3=not purge_from_s3, dry_run=dry_run
+        )
 
 
 @click.command()
 @click.option("--force", is_flag=True, help="Skip confirmation for cleanup")
-@click.option("--no-sign-request", is_flag=True, help="Use unsigned S3 requests")
 @click.option(
-    "--use-acceleration", is_flag=True, help="Enable S3 Transfer Acceleration"
+    "--inventory",
+    metavar="S3_URL",
+    help="Read object keys from an S3 Inventory (s3://.../manifest.json) "
+    "instead of listing the bucket",
 )
-def cleanup(force, no_sign_request, use_acceleration):
+@dry_run_option
+@s3_options
+def cleanup(force, inventory, dry_run, no_sign_request, use_acceleration):
     """Clean up unreferenced files from S3."""
     # Find git root
     git_root = find_git_root()
@@ -346,12 +556,13 @@ def cleanup(force, no_sign_request, use_acceleration):
         click.echo("Error: S3LFS not initialized. Run 's3lfs init' first.")
         raise click.Abort()
 
-    versioner = S3LFS(
+    versioner = _make_s3lfs(
         no_sign_request=no_sign_request,
         manifest_file=str(manifest_path),
         use_acceleration=use_acceleration,
     )
-    versioner.cleanup_s3(force=force)
+    keys_iter = versioner.iter_inventory_keys(inventory) if inventory else None
+    versioner.cleanup_s3(force=force, keys_iter=keys_iter, dry_run=dry_run)
 
 
 @click.command()
@@ -438,13 +649,13 @@ def migrate(force):
     click.echo("  4. Update .gitignore if needed")
 
 
-cli.add_command(init)
-cli.add_command(track)
-cli.add_command(checkout)
-cli.add_command(ls)
-cli.add_command(remove)
-cli.add_command(cleanup)
-cli.add_command(migrate)
+COMMANDS = (init, track, checkout, ls, remove, cleanup, migrate)
+
+for command in COMMANDS:
+    # add_command silently replaces an existing entry; fail loudly instead so a
+    # second command reusing a name cannot shadow the first one.
+    assert command.name not in cli.commands, f"duplicate command {command.name!r}"
+    cli.add_command(command)
 
 
 def main():
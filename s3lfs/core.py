@@ -1,11 +1,15 @@
+import asyncio
 import contextlib
+import csv
 import fnmatch
 import glob
 import gzip
 import hashlib
+import itertools
 import json
 import mmap
 import os
+import pickle
 import re
 import shutil
 import signal
@@ -13,10 +17,17 @@ import subprocess
 import sys
 import threading
 import time
-from concurrent.futures import CancelledError, ThreadPoolExecutor, as_completed
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    CancelledError,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Callable, Optional, Union
+from urllib.parse import unquote_plus, urlparse
 from uuid import uuid4
 
 import boto3
@@ -34,6 +45,18 @@ from botocore.exceptions import (
 from tqdm import tqdm
 from urllib3.exceptions import SSLError
 
+try:
+    from aiobotocore.config import AioConfig
+    from aiobotocore.session import get_session as get_aio_session
+except ImportError:  # aiobotocore is an optional dependency (s3lfs[async])
+    AioConfig = None
+    get_aio_session = None
+
+try:
+    import blake3
+except ImportError:  # blake3 is an optional dependency (s3lfs[blake3])
+    blake3 = None
+
 from s3lfs import metrics
 from s3lfs.path_resolver import PathResolver
 from s3lfs.utils import find_git_root
@@ -44,6 +67,11 @@ DEFAULT_BUFFER_SIZE = 1024 * 1024  # 1 MB
 DEFAULT_THREAD_POOL_SIZE = 8  # Optimal for bandwidth-limited scenarios
 DEFAULT_MULTIPART_THRESHOLD = 5 * 1024 * 1024 * 1024  # 5 GB
 DEFAULT_MAX_CONCURRENCY = 15  # Balanced for bandwidth-limited downloads
+DEFAULT_MULTIPART_CHUNKSIZE = 16 * 1024 * 1024  # 16 MB saturates a single connection
+DEFAULT_ASYNC_CONCURRENCY = 64  # In-flight requests for the asyncio download path
+DEFAULT_TRACK_QUEUE_DEPTH = (
+    4 * DEFAULT_THREAD_POOL_SIZE
+)  # Paths queued ahead of workers
 
 # Common error messages
 ERROR_MESSAGES = {
@@ -52,8 +80,11 @@ ERROR_MESSAGES = {
     "invalid_credentials": "Invalid AWS credentials. Please verify your access key and secret key.",
     "s3_access_denied": "Invalid or insufficient AWS credentials for bucket '{bucket_name}'.",
     "acceleration_not_supported": "Transfer acceleration is not supported for unsigned requests.",
+    "blake3_not_installed": "The blake3 local hash requires the 'blake3' package (pip install s3lfs[blake3]).",
 }
 
+LOCAL_HASH_ALGORITHMS = ("sha256", "blake3")
+
 
 def retry(times, exceptions):
     """
@@ -97,6 +128,11 @@ class S3LFS:
         chunk_size=DEFAULT_CHUNK_SIZE,
         s3_factory=None,
         use_acceleration=False,
+        max_concurrency=DEFAULT_MAX_CONCURRENCY,
+        multipart_chunksize=DEFAULT_MULTIPART_CHUNKSIZE,
+        manifest_cache=None,
+        local_hash="sha256",
+        thread_pool_size=DEFAULT_THREAD_POOL_SIZE,
     ):
         """
         :param bucket_name: Name of the S3 bucket (can be stored in manifest)
@@ -108,25 +144,49 @@ class S3LFS:
         :param chunk_size: Size of chunks for multipart uploads (default: 5 GB)
         :param s3_factory: Custom S3 client factory function (for testing)
         :param use_acceleration: If True, enable S3 Transfer Acceleration
+        :param max_concurrency: Number of parallel part transfers per file
+        :param multipart_chunksize: Part size in bytes for multipart transfers
+        :param manifest_cache: Optional path of a pickled copy of the parsed manifest,
+                               reused while the manifest file is unchanged
+                               (default: $S3LFS_MANIFEST_CACHE)
+        :param local_hash: Hash used to detect unchanged content in the local hash
+                           cache when a file's metadata changed ("sha256" or
+                           "blake3"). Manifest and S3 keys always use SHA-256.
+        :param thread_pool_size: Number of files hashed/transferred in parallel
         """
         self.chunk_size = chunk_size
         self.use_acceleration = use_acceleration
 
+        if local_hash not in LOCAL_HASH_ALGORITHMS:
+            raise ValueError(f"Unsupported local hash: {local_hash}")
+        if local_hash == "blake3" and blake3 is None:
+            raise RuntimeError(ERROR_MESSAGES["blake3_not_installed"])
+        self.local_hash = local_hash
+        self.thread_pool_size = thread_pool_size
+
+        # Each thread's client is shared by that thread's TransferManager workers,
+        # so size its connection pool for max_concurrency parallel part transfers
+        # instead of botocore's default of 10.
+        client_config = Config(max_pool_connections=max(10, max_concurrency))
+
         def default_s3_factory(no_sign_request):
             """Default S3 client factory with proper boto3 usage."""
             if no_sign_request:
                 if self.use_acceleration:
                     raise RuntimeError(ERROR_MESSAGES["acceleration_not_supported"])
-                config = Config(signature_version=UNSIGNED)
+                config = client_config.merge(Config(signature_version=UNSIGNED))
                 return boto3.client("s3", config=config)
             else:
                 if self.use_acceleration:
                     # Use transfer acceleration endpoint
                     return boto3.client(
-                        "s3", config=Config(s3={"use_accelerate_endpoint": True})
+                        "s3",
+                        config=client_config.merge(
+                            Config(s3={"use_accelerate_endpoint": True})
+                        ),
                     )
                 else:
-                    return boto3.client("s3")
+                    return boto3.client("s3", config=client_config)
 
         self.s3_factory = s3_factory if s3_factory is not None else default_s3_factory
 
@@ -141,12 +201,24 @@ class S3LFS:
             # If we're not signing, we can't use multipart. Set the threshold to the max.
             self.config = TransferConfig(
                 multipart_threshold=DEFAULT_MULTIPART_THRESHOLD,
-                max_concurrency=DEFAULT_MAX_CONCURRENCY,
+                multipart_chunksize=multipart_chunksize,
+                max_concurrency=max_concurrency,
             )
         else:
-            self.config = TransferConfig(max_concurrency=DEFAULT_MAX_CONCURRENCY)
+            self.config = TransferConfig(
+                multipart_chunksize=multipart_chunksize,
+                max_concurrency=max_concurrency,
+            )
+        # Downloads split large objects into parallel ranged GETs, which works with
+        # unsigned requests too, so they always use the default multipart threshold.
+        self.download_config = TransferConfig(
+            multipart_chunksize=multipart_chunksize,
+            max_concurrency=max_concurrency,
+        )
         self.thread_local = threading.local()
         self.manifest_file = Path(manifest_file)
+        manifest_cache = manifest_cache or os.environ.get("S3LFS_MANIFEST_CACHE")
+        self.manifest_cache = Path(manifest_cache) if manifest_cache else None
 
         # Separate cache file - should NOT be version controlled
         # Use same format as manifest (YAML or JSON)
@@ -331,15 +403,62 @@ class S3LFS:
     def load_manifest(self):
         """Load the local manifest (YAML or JSON format)."""
         if self.manifest_file.exists():
+            cache_key = self._manifest_cache_key()
+            cached = self._read_manifest_cache(cache_key)
+            if cached is not None:
+                self.manifest = cached
+                return
+
             with open(self.manifest_file, "r") as f:
                 # Detect format based on extension
                 if self.manifest_file.suffix in [".yaml", ".yml"]:
                     self.manifest = yaml.safe_load(f) or {"files": {}}
                 else:
                     self.manifest = json.load(f)
+
+            self._write_manifest_cache(cache_key)
         else:
             self.manifest = {"files": {}}  # Use file paths as keys
 
+    def _manifest_cache_key(self):
+        """
+        Identify the current on-disk manifest for the pickled manifest cache.
+
+        The manifest is only ever replaced atomically, so a change of path, size or
+        nanosecond mtime is enough to invalidate a cached copy.
+        """
+        if self.manifest_cache is None:
+            return None
+        stat = self.manifest_file.stat()
+        return (str(self.manifest_file.resolve()), stat.st_mtime_ns, stat.st_size)
+
+    def _read_manifest_cache(self, cache_key):
+        """Return the cached manifest if it matches ``cache_key``, else None."""
+        if cache_key is None or not self.manifest_cache.exists():
+            return None
+        try:
+            with open(self.manifest_cache, "rb") as f:
+                key, manifest = pickle.load(f)
+        except Exception:
+            return None  # Unreadable or stale format; just re-parse the manifest
+        return manifest if key == cache_key else None
+
+    def _write_manifest_cache(self, cache_key):
+        """Store the freshly parsed manifest next to its cache key (best effort)."""
+        if cache_key is None:
+            return
+        temp_file = self.manifest_cache.with_name(
+            f"{self.manifest_cache.name}.{uuid4().hex}.tmp"
+        )
+        try:
+            self.manifest_cache.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_file, "wb") as f:
+                pickle.dump((cache_key, self.manifest), f, pickle.HIGHEST_PROTOCOL)
+            temp_file.replace(self.manifest_cache)
+        except (OSError, pickle.PicklingError):
+            if temp_file.exists():
+                temp_file.unlink()
+
     def save_manifest(self):
         """Save the manifest back to disk atomically (YAML or JSON format)."""
         temp_file = self.manifest_file.with_suffix(
@@ -358,6 +477,7 @@ class S3LFS:
 
             # Atomically move the temporary file to the target location
             temp_file.replace(self.manifest_file)
+            self._write_manifest_cache(self._manifest_cache_key())
         except Exception as e:
             print(f"❌ Failed to save manifest: {e}")
             if temp_file.exists():
@@ -409,9 +529,9 @@ class S3LFS:
 
         :param file_path: Path to the file to hash.
         :param method: Hashing method to use. Options are:
-                    - "auto": Automatically select the best method.
-                    - "mmap": Use memory-mapped files (default for non-empty files).
-                    - "iter": Use an iterative read approach (fallback for empty files).
+                    - "auto": Automatically select the best method ("iter").
+                    - "mmap": Use memory-mapped files.
+                    - "iter": Read the file in 1 MB chunks into hashlib.
                     - "cli": Use the `sha256sum` CLI utility (POSIX only).
         :return: The computed SHA-256 hash as a hexadecimal string.
         """
@@ -421,15 +541,12 @@ class S3LFS:
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
 
-        # Automatically select the best method if "auto" is specified
+        # Automatically select the best method if "auto" is specified. hashlib
+        # hashes with OpenSSL (SHA-NI/ARMv8 SHA2 where available) and releases the
+        # GIL for large updates, so threads hash in parallel without paying for a
+        # sha256sum process per file.
         if method == "auto":
-            if file_path.stat().st_size == 0:  # Empty file
-                method = "iter"
-            elif shutil.which("sha256sum"):
-                # Prefer CLI - no GIL contention, better parallelism
-                method = "cli"
-            else:
-                method = "mmap"
+            method = "iter"
 
         # Use the selected hashing method
         if method == "mmap":
@@ -493,8 +610,20 @@ class S3LFS:
             # Release lock while computing hash (can be expensive)
             pass
 
-        # Compute hash outside of lock to avoid blocking other processes
-        new_hash = self.hash_file(file_path, method)
+        # Compute hash outside of lock to avoid blocking other processes. With the
+        # blake3 local hash, a file whose metadata changed but whose content did not
+        # (touch, re-checkout) keeps its cached SHA-256 without a SHA-256 pass.
+        local_digest = None
+        if self.local_hash == "blake3":
+            local_digest = self._hash_file_blake3(file_path)
+        if (
+            local_digest is not None
+            and cached_data
+            and cached_data.get("blake3") == local_digest
+        ):
+            new_hash = cached_data["hash"]
+        else:
+            new_hash = self.hash_file(file_path, method)
 
         # Acquire lock again to update cache
         with self._lock_context():
@@ -519,6 +648,8 @@ class S3LFS:
                 "metadata": current_metadata,
                 "timestamp": time.time(),  # When hash was computed
             }
+            if local_digest is not None:
+                self.hash_cache[file_path_str]["blake3"] = local_digest
 
             # Save cache with updated data
             self.save_cache()
@@ -629,15 +760,19 @@ class S3LFS:
                 print(f"🗑 Cleaned up {len(stale_entries)} stale cache entries.")
                 self.save_cache()  # Only save if changes were made
 
-    def track_modified_files_cached(self, silence=True):
+    def track_modified_files_cached(
+        self, silence=True, git_fastpath=False, dry_run=False
+    ):
         """
         Check manifest for outdated hashes using cached hashing and upload changed files in parallel.
         This is an optimized version of track_modified_files that uses hash caching.
-        """
-        files_to_upload = []
-        cache_hits = 0
-        cache_misses = 0
 
+        :param silence: Suppress per-file progress output
+        :param git_fastpath: Skip files that git tracks and reports as unchanged
+                             from HEAD. Falls back to checking every file when git
+                             is unavailable.
+        :param dry_run: Report the files that would be uploaded without uploading
+        """
         with self._lock_context():
             files_to_check = list(
                 self.manifest["files"].keys()
@@ -649,6 +784,64 @@ class S3LFS:
             )
             return
 
+        if git_fastpath:
+            unmodified = self._git_unmodified_files()
+            if unmodified is not None:
+                candidates = [f for f in files_to_check if f not in unmodified]
+                print(
+                    f"⚡ git reports {len(files_to_check) - len(candidates)} tracked "
+                    f"file(s) unchanged since HEAD"
+                )
+                files_to_check = candidates
+
+        self.track_paths(files_to_check, silence=silence, dry_run=dry_run)
+
+    def _git_unmodified_files(self):
+        """
+        Return the manifest keys that git tracks and reports as unchanged from HEAD.
+
+        Files git does not track (including ignored files) are never in the result,
+        so they are always re-checked. Returns None if git cannot answer, e.g. when
+        the repository has no HEAD yet or git is not installed.
+        """
+        git_root = self.path_resolver.git_root
+        if not (git_root / ".git").exists():
+            return None
+
+        try:
+            tracked = subprocess.run(
+                ["git", "ls-files", "-z"],
+                cwd=git_root,
+                capture_output=True,
+                check=True,
+            ).stdout
+            changed = subprocess.run(
+                ["git", "diff", "--name-only", "-z", "HEAD"],
+                cwd=git_root,
+                capture_output=True,
+                check=True,
+            ).stdout
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+        def split_paths(output):
+            return {os.fsdecode(p) for p in output.split(b"\0") if p}
+
+        return split_paths(tracked) - split_paths(changed)
+
+    def track_paths(self, paths, silence=True, dry_run=False):
+        """
+        Check the given manifest keys for outdated hashes and upload changed files.
+
+        :param paths: Manifest keys to check (typically a subset of the manifest)
+        :param silence: Suppress per-file progress output
+        :param dry_run: Report the files that would be uploaded without uploading
+        """
+        files_to_upload = []
+        cache_hits = 0
+        cache_misses = 0
+        files_to_check = list(paths)
+
         print(f"🔍 Checking {len(files_to_check)} tracked files for modifications...")
 
         # Use cached hashing for better performance with progress indication
@@ -699,7 +892,9 @@ class S3LFS:
             print(f"📊 Hash cache performance: {cache_hits} hits, {cache_misses} misses")
 
         # Upload files in parallel if needed
-        if files_to_upload:
+        if files_to_upload and dry_run:
+            self._report_dry_run("upload", files_to_upload)
+        elif files_to_upload:
             print(f"📤 Uploading {len(files_to_upload)} modified file(s) in parallel...")
             self.parallel_upload(files_to_upload, silence=silence)
 
@@ -747,6 +942,15 @@ class S3LFS:
                     hasher.update(chunk)
             return hasher.hexdigest()
 
+    def _hash_file_blake3(self, file_path):
+        """
+        Compute the BLAKE3 hash of a file (local change detection only).
+
+        update_mmap hashes the memory-mapped file on blake3's own thread pool.
+        """
+        hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+        return hasher.update_mmap(str(file_path)).hexdigest()
+
     def _hash_file_cli(self, file_path):
         """
         Compute the SHA-256 hash using the `sha256sum` CLI utility (POSIX only).
@@ -1168,7 +1372,7 @@ class S3LFS:
         if not silence:
             print(f"Uploaded {file_path} -> s3://{self.bucket_name}/{s3_key}")
 
-    def remove_file(self, file_path, keep_in_s3=True):
+    def remove_file(self, file_path, keep_in_s3=True, dry_run=False):
         """
         Remove a file from tracking.
         If `keep_in_s3` is True, the file will remain in S3 to support previous git commits.
@@ -1176,6 +1380,7 @@ class S3LFS:
 
         :param file_path: The local file path to remove from tracking.
         :param keep_in_s3: If False, schedule the file for deletion in future GC.
+        :param dry_run: Report what would be removed without changing anything.
         """
         file_path = Path(file_path)
         file_path_str = str(file_path.as_posix())
@@ -1184,6 +1389,12 @@ class S3LFS:
             if file_path_str not in self.manifest["files"]:
                 print(f"⚠️ File '{file_path}' is not currently tracked.")
                 return
+            if dry_run:
+                self._report_dry_run(
+                    "untrack" if keep_in_s3 else "untrack and purge from S3",
+                    [file_path_str],
+                )
+                return
 
             # Retrieve the file hash before removal
             file_hash = self.manifest["files"].pop(file_path_str, None)
@@ -1192,43 +1403,46 @@ class S3LFS:
         print(f"🗑 Removed tracking for '{file_path}'.")
 
         if not keep_in_s3:
-            s3_key = f"{self.repo_prefix}/assets/{file_hash}/{file_path.as_posix()}.gz"
-            self._get_s3_client().delete_object(Bucket=self.bucket_name, Key=s3_key)
-            print(f"🗑 File removed from S3: s3://{self.bucket_name}/{s3_key}")
+            for s3_key in self._stored_object_keys([(file_path_str, file_hash)]):
+                self._get_s3_client().delete_object(Bucket=self.bucket_name, Key=s3_key)
+                print(f"🗑 File removed from S3: s3://{self.bucket_name}/{s3_key}")
         else:
             print(
                 f"⚠️ File remains in S3: s3://{self.bucket_name}/{file_hash}/{file_path.as_posix()}"
             )
 
-    def cleanup_s3(self, force=False):
+    def cleanup_s3(self, force=False, keys_iter=None, dry_run=False):
         """
         Remove unreferenced assets from S3 that are not in the current manifest.
 
         :param force: If True, bypass confirmation (for automated tests).
+        :param keys_iter: Optional iterable of object keys to consider instead of
+                          listing the bucket, e.g. from iter_inventory_keys().
+                          Keys outside this repository's assets are ignored.
+        :param dry_run: List the unreferenced objects without deleting them. Only
+                        read requests (the listing) are sent.
         """
         with self._lock_context():
             current_hashes = set(self.manifest["files"].values())
 
-        paginator = self._get_s3_client().get_paginator("list_objects_v2")
-        pages = paginator.paginate(
-            Bucket=self.bucket_name, Prefix=f"{self.repo_prefix}/assets/"
-        )
+        assets_prefix = f"{self.repo_prefix}/assets/"
+        if keys_iter is None:
+            keys_iter = self._iter_asset_keys(assets_prefix)
 
         unreferenced_files = []
 
-        for page in pages:
-            if "Contents" in page:
-                for obj in page["Contents"]:
-                    key = obj["Key"]
-                    parts = key.replace(f"{self.repo_prefix}/", "").split("/")
-                    if len(parts) < 3:
-                        continue
+        for key in keys_iter:
+            if not key.startswith(assets_prefix):
+                continue
+            parts = key.replace(f"{self.repo_prefix}/", "").split("/")
+            if len(parts) < 3:
+                continue
 
-                    file_hash = parts[1]  # Extract the hash from the S3 key
+            file_hash = parts[1]  # Extract the hash from the S3 key
 
-                    # Collect unreferenced files
-                    if file_hash not in current_hashes:
-                        unreferenced_files.append(key)
+            # Collect unreferenced files
+            if file_hash not in current_hashes:
+                unreferenced_files.append(key)
 
         if not unreferenced_files:
             print("✅ No unreferenced files found in S3.")
@@ -1236,6 +1450,10 @@ class S3LFS:
 
         print(f"⚠️ Found {len(unreferenced_files)} unreferenced files in S3.")
 
+        if dry_run:
+            self._report_dry_run("delete", unreferenced_files)
+            return
+
         # If not in test mode, ask for confirmation
         if not force:
             confirm = input("Do you want to delete them? (yes/no): ").strip().lower()
@@ -1250,6 +1468,60 @@ class S3LFS:
 
         print("✅ S3 cleanup completed.")
 
+    def _iter_asset_keys(self, prefix):
+        """Yield every object key under ``prefix`` using paginated LIST calls."""
+        paginator = self._get_s3_client().get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix):
+            for obj in page.get("Contents", []):
+                yield obj["Key"]
+
+    def iter_inventory_keys(self, inventory_url):
+        """
+        Yield the object keys of this bucket listed in an S3 Inventory report.
+
+        Reading a CSV inventory replaces one LIST request per 1000 keys with one
+        GET per inventory part, which is much cheaper for large buckets. The
+        report can be up to a day old. Objects created since then are not
+        listed, so they are never treated as unreferenced.
+
+        :param inventory_url: s3:// URL of the inventory's manifest.json
+        """
+        parsed = urlparse(inventory_url)
+        if parsed.scheme != "s3" or not parsed.netloc or not parsed.path:
+            raise ValueError(
+                f"Inventory must be an s3://bucket/.../manifest.json URL, "
+                f"got '{inventory_url}'"
+            )
+        inventory_bucket = parsed.netloc
+        client = self._get_s3_client()
+
+        response = client.get_object(
+            Bucket=inventory_bucket, Key=parsed.path.lstrip("/")
+        )
+        manifest = json.loads(response["Body"].read())
+        if manifest.get("fileFormat", "").upper() != "CSV":
+            raise ValueError(
+                f"Only CSV inventories are supported, got '{manifest.get('fileFormat')}'"
+            )
+
+        columns = [c.strip() for c in manifest["fileSchema"].split(",")]
+        bucket_column = columns.index("Bucket")
+        key_column = columns.index("Key")
+
+        def read_part(part):
+            body = client.get_object(Bucket=inventory_bucket, Key=part["key"])["Body"]
+            with gzip.open(body, "rt", newline="") as f:
+                return [
+                    unquote_plus(row[key_column])
+                    for row in csv.reader(f)
+                    if row[bucket_column] == self.bucket_name
+                ]
+
+        # Fetch the parts concurrently; map() keeps results in inventory order
+        with ThreadPoolExecutor(max_workers=self.thread_pool_size) as executor:
+            for keys in executor.map(read_part, manifest["files"]):
+                yield from keys
+
     def track_modified_files(self, silence=True):
         """Check manifest for outdated hashes and upload changed files in parallel."""
 
@@ -1260,7 +1532,7 @@ class S3LFS:
             )  # Files listed in the manifest
 
         # Compute hashes in parallel
-        with ThreadPoolExecutor(max_workers=DEFAULT_THREAD_POOL_SIZE) as executor:
+        with ThreadPoolExecutor(max_workers=self.thread_pool_size) as executor:
             results = zip(files_to_check, executor.map(self.hash_file, files_to_check))
 
         # Process results
@@ -1294,7 +1566,7 @@ class S3LFS:
             print("🔐 Testing S3 credentials...")
         self.test_s3_credentials(silence=silence)
 
-        with ThreadPoolExecutor(max_workers=DEFAULT_THREAD_POOL_SIZE) as executor:
+        with ThreadPoolExecutor(max_workers=self.thread_pool_size) as executor:
             # Submit each download task; unpack key from matching_files.items()
             futures = [
                 executor.submit(
@@ -1330,7 +1602,7 @@ class S3LFS:
         self.test_s3_credentials()
 
         try:
-            with ThreadPoolExecutor(max_workers=DEFAULT_THREAD_POOL_SIZE) as executor:
+            with ThreadPoolExecutor(max_workers=self.thread_pool_size) as executor:
                 # Submit all tasks and collect futures
                 futures = [
                     executor.submit(self.download, kv[0], silence=silence)
@@ -1359,7 +1631,163 @@ class S3LFS:
         finally:
             print("✅ All files downloaded.")
 
-    def remove_subtree(self, directory, keep_in_s3=True):
+    async def parallel_download_all_async(self, silence=True, concurrency=None):
+        """
+        Download all files listed in the manifest from a single asyncio event loop.
+
+        When aiobotocore is installed, one shared async S3 client keeps up to
+        ``concurrency`` requests in flight without a thread per request. Otherwise
+        the synchronous ``download`` is run on worker threads with the same bound.
+
+        :param silence: Silences verbose logging.
+        :param concurrency: Maximum number of concurrent downloads. Defaults to
+                            $S3LFS_ASYNC_CONCURRENCY or DEFAULT_ASYNC_CONCURRENCY.
+        """
+        with self._lock_context():
+            items = list(self.manifest["files"].items())
+
+        if not items:
+            print("⚠️ Manifest is empty. Nothing to download.")
+            return
+
+        if concurrency is None:
+            concurrency = int(
+                os.environ.get("S3LFS_ASYNC_CONCURRENCY", DEFAULT_ASYNC_CONCURRENCY)
+            )
+
+        print("📥 Starting async download of all tracked files...")
+
+        # Test S3 credentials once before starting the parallel download
+        self.test_s3_credentials()
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        with tqdm(total=len(items), desc="Downloading files") as pbar:
+
+            async def bounded_download(client, file_path, expected_hash):
+                async with semaphore:
+                    if self._shutdown_requested:
+                        return
+                    try:
+                        if client is None:
+                            await asyncio.to_thread(
+                                self.download,
+                                file_path,
+                                silence=silence,
+                                expected_hash=expected_hash,
+                            )
+                        else:
+                            await self._download_async(
+                                client, file_path, expected_hash, silence=silence
+                            )
+                    except Exception as e:
+                        print(f"An unexpected error occurred: {e}")
+                    finally:
+                        pbar.update(1)
+
+            if get_aio_session is None:
+                await asyncio.gather(*(bounded_download(None, k, h) for k, h in items))
+            else:
+                async with self._create_aio_client(concurrency) as client:
+                    await asyncio.gather(
+                        *(bounded_download(client, k, h) for k, h in items)
+                    )
+
+        print("✅ All files downloaded.")
+
+    def _create_aio_client(self, max_pool_connections):
+        """
+        Create an aiobotocore S3 client context manager matching this instance's
+        signing and acceleration settings.
+        """
+        config_kwargs = {"max_pool_connections": max_pool_connections}
+        if self.no_sign_request:
+            if self.use_acceleration:
+                raise RuntimeError(ERROR_MESSAGES["acceleration_not_supported"])
+            config_kwargs["signature_version"] = UNSIGNED
+        elif self.use_acceleration:
+            config_kwargs["s3"] = {"use_accelerate_endpoint": True}
+        return get_aio_session().create_client("s3", config=AioConfig(**config_kwargs))
+
+    async def _download_async(self, client, manifest_key, expected_hash, silence=True):
+        """
+        Download a single manifest entry using an aiobotocore client.
+        Returns the number of bytes written (0 if the local file was up-to-date).
+
+        :param client: An open aiobotocore S3 client
+        :param manifest_key: Manifest key (relative to git root)
+        :param expected_hash: Hash recorded for the file in the manifest
+        :param silence: Silences verbose logging.
+        """
+        filesystem_path = self.path_resolver.to_filesystem_path(manifest_key)
+
+        # Hashing is CPU/disk bound, keep it off the event loop
+        if filesystem_path.exists():
+            current_hash = await asyncio.to_thread(self.hash_file, filesystem_path)
+            if current_hash == expected_hash:
+                return 0
+
+        s3_key = f"{self.repo_prefix}/assets/{expected_hash}/{manifest_key}.gz"
+        response = await client.list_objects_v2(
+            Bucket=self.bucket_name, Prefix=f"{s3_key}.chunk"
+        )
+        chunk_count = len(response.get("Contents", []))
+        keys = [f"{s3_key}.chunk{i}" for i in range(chunk_count)] or [s3_key]
+
+        compressed_path = self.temp_dir / f"{uuid4()}.gz"
+        try:
+            # Chunks are appended in order, so no separate merge pass is needed
+            with open(compressed_path, "wb") as f:
+                for key in keys:
+                    response = await client.get_object(Bucket=self.bucket_name, Key=key)
+                    body = response["Body"]
+                    try:
+                        while chunk := await body.read(DEFAULT_BUFFER_SIZE):
+                            f.write(chunk)
+                    finally:
+                        body.close()
+
+            filesystem_path.parent.mkdir(parents=True, exist_ok=True)
+            await asyncio.to_thread(
+                self.decompress_file, compressed_path, filesystem_path
+            )
+        finally:
+            if compressed_path.exists():
+                os.remove(compressed_path)
+
+        if not silence:
+            print(
+                f"📥 Downloaded {filesystem_path} from s3://{self.bucket_name}/{s3_key}"
+            )
+        return filesystem_path.stat().st_size
+
+    def _stored_object_keys(self, files):
+        """
+        Return the S3 keys holding the given files, including chunk objects.
+
+        A large file is stored as '<key>.gz.chunk<i>' objects instead of '<key>.gz',
+        so the keys are listed rather than derived. Files are grouped by hash and
+        each '<prefix>/assets/<hash>/' directory is listed once; the trailing slash
+        keeps the listing to that directory.
+
+        :param files: Iterable of (manifest_key, file_hash) pairs
+        """
+        by_hash = {}
+        for manifest_key, file_hash in files:
+            if file_hash:
+                by_hash.setdefault(file_hash, set()).add(f"{manifest_key}.gz")
+
+        keys = []
+        for file_hash, names in by_hash.items():
+            hash_prefix = f"{self.repo_prefix}/assets/{file_hash}/"
+            for key in self._iter_asset_keys(hash_prefix):
+                name = key[len(hash_prefix) :]
+                base, chunk, index = name.rpartition(".chunk")
+                if name in names or (chunk and index.isdigit() and base in names):
+                    keys.append(key)
+        return keys
+
+    def remove_subtree(self, directory, keep_in_s3=True, dry_run=False):
         """
         Remove files matching a pattern from tracking.
         Handles single files, directories, and glob patterns uniformly.
@@ -1367,6 +1795,7 @@ class S3LFS:
 
         :param directory: The path, directory, or glob pattern to remove from tracking.
         :param keep_in_s3: If False, delete the files from S3 as well.
+        :param dry_run: Report what would be removed without changing anything.
         """
         directory = Path(directory)
         pattern = str(directory.as_posix())
@@ -1393,10 +1822,19 @@ class S3LFS:
             print(f"⚠️ No tracked files found matching '{directory}'.")
             return
 
-        for file_path in files_to_remove:
-            file_hash = self.manifest["files"].pop(file_path, None)
-            if not keep_in_s3 and file_hash:
-                s3_key = f"{self.repo_prefix}/assets/{file_hash}/{file_path}.gz"
+        if dry_run:
+            self._report_dry_run(
+                "untrack" if keep_in_s3 else "untrack and purge from S3",
+                files_to_remove,
+            )
+            return
+
+        removed = [
+            (file_path, self.manifest["files"].pop(file_path, None))
+            for file_path in files_to_remove
+        ]
+        if not keep_in_s3:
+            for s3_key in self._stored_object_keys(removed):
                 self._get_s3_client().delete_object(Bucket=self.bucket_name, Key=s3_key)
                 print(f"🗑 File removed from S3: s3://{self.bucket_name}/{s3_key}")
 
@@ -1471,6 +1909,16 @@ class S3LFS:
             This method converts to filesystem path: "/repo/subdir/*.txt"
             Glob finds actual files: ["/repo/subdir/a.txt", "/repo/subdir/b.txt"]
         """
+        return list(self._iter_filesystem_paths(path))
+
+    def _iter_filesystem_paths(self, path):
+        """
+        Lazily yield the files matched by ``path`` as absolute paths.
+
+        Same matching rules as _resolve_filesystem_paths, but directories are walked
+        with os.scandir and globs with glob.iglob, so callers can start working on
+        the first files before the whole tree has been enumerated.
+        """
         # Handle both manifest keys and absolute paths
         path_obj = Path(path)
         if path_obj.is_absolute():
@@ -1484,28 +1932,38 @@ class S3LFS:
 
         # If it's an existing file, return it directly
         if filesystem_path.is_file():
-            resolved_files = [filesystem_path]
+            yield filesystem_path.resolve()
         # If it's an existing directory, get all files recursively
         elif filesystem_path.is_dir():
-            resolved_files = [f for f in filesystem_path.rglob("*") if f.is_file()]
+            for f in self._walk_files(filesystem_path):
+                yield f.resolve()
         else:
             # Otherwise treat as a glob pattern against the filesystem
-            matched_paths = glob.glob(str(filesystem_path), recursive=True)
-
-            # Handle both files and directories that match the pattern
-            resolved_files = []
-            for p in matched_paths:
+            for p in glob.iglob(str(filesystem_path), recursive=True):
                 path_obj = Path(p)
                 if path_obj.is_file():
-                    resolved_files.append(path_obj)
+                    yield path_obj.resolve()
                 elif path_obj.is_dir():
                     # For directories, find all files recursively
-                    resolved_files.extend(
-                        [f for f in path_obj.rglob("*") if f.is_file()]
-                    )
+                    for f in self._walk_files(path_obj):
+                        yield f.resolve()
+
+    @staticmethod
+    def _walk_files(directory):
+        """
+        Yield every file below ``directory``.
 
-        # Return absolute paths
-        return [p.resolve() for p in resolved_files]
+        Like ``Path.rglob("*")`` filtered to files, symlinked directories are not
+        descended into, but scandir's cached d_type saves a stat per entry.
+        """
+        pending = [directory]
+        while pending:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.is_file():
+                        yield Path(entry.path)
 
     def _resolve_manifest_paths(self, path):
         """
@@ -1637,7 +2095,9 @@ class S3LFS:
             # All segments matched
             return True
 
-    def track(self, path, silence=True, interleaved=True, use_cache=True):
+    def track(
+        self, path, silence=True, interleaved=True, use_cache=True, dry_run=False
+    ):
         """
         Track and upload files, directories, or globs.
 
@@ -1645,7 +2105,12 @@ class S3LFS:
         :param silence: Silences verbose logging.
         :param interleaved: If True, use interleaved hashing and uploading for better performance.
         :param use_cache: If True, use cached hashing for better performance on repeated operations.
+        :param dry_run: Hash the files and report which would be uploaded, without
+                        any S3 requests or manifest changes.
         """
+        if dry_run:
+            return self._track_dry_run(path, use_cache=use_cache)
+
         if interleaved:
             return self.track_interleaved(path, silence=silence, use_cache=use_cache)
 
@@ -1660,7 +2125,7 @@ class S3LFS:
 
         # Compute hashes in parallel with a progress bar
         with tqdm(total=len(files_to_track), desc="Hashing files", unit="file") as pbar:
-            with ThreadPoolExecutor(max_workers=DEFAULT_THREAD_POOL_SIZE) as executor:
+            with ThreadPoolExecutor(max_workers=self.thread_pool_size) as executor:
                 if use_cache:
 
                     def hash_func(f):
@@ -1702,7 +2167,7 @@ class S3LFS:
         # Phase 3: Upload files needing updates
         print("🚀 Uploading files...")
         try:
-            with ThreadPoolExecutor(max_workers=DEFAULT_THREAD_POOL_SIZE) as executor:
+            with ThreadPoolExecutor(max_workers=self.thread_pool_size) as executor:
                 futures = [
                     executor.submit(
                         self.upload,
@@ -1740,6 +2205,29 @@ class S3LFS:
 
         print(f"✅ Successfully tracked and uploaded files for '{path}'.")
 
+    def _track_dry_run(self, path, use_cache=True):
+        """Report the files under ``path`` whose hash differs from the manifest."""
+        hash_func = self.hash_file_cached if use_cache else self.hash_file
+        with ThreadPoolExecutor(max_workers=self.thread_pool_size) as executor:
+            file_hashes = executor.map(
+                lambda f: (self._get_manifest_key(f), hash_func(f)),
+                self._iter_filesystem_paths(path),
+            )
+            with self._lock_context():
+                files = self.manifest["files"]
+                changed = [key for key, h in file_hashes if files.get(key) != h]
+
+        if changed:
+            self._report_dry_run("upload", changed)
+        else:
+            print("✅ All files are up-to-date. No uploads needed.")
+
+    def _report_dry_run(self, action, items):
+        """Print the items a dry run would have acted on."""
+        for item in items:
+            print(f"🔎 Would {action}: {item}")
+        print(f"🔎 Dry run: {len(items)} item(s) would be affected; nothing was changed.")
+
     def _hash_with_progress_cached(self, file_path, progress_bar):
         """
         Helper function to compute the cached hash of a file and update the progress bar.
@@ -1787,7 +2275,7 @@ class S3LFS:
         with tqdm(
             total=len(files_to_checkout), desc="Hashing files", unit="file"
         ) as pbar:
-            with ThreadPoolExecutor(max_workers=DEFAULT_THREAD_POOL_SIZE) as executor:
+            with ThreadPoolExecutor(max_workers=self.thread_pool_size) as executor:
                 if use_cache:
 
                     def hash_func(f):
@@ -1831,7 +2319,7 @@ class S3LFS:
         # Phase 3: Download files that need updates
         print("🚀 Downloading files...")
         try:
-            with ThreadPoolExecutor(max_workers=DEFAULT_THREAD_POOL_SIZE) as executor:
+            with ThreadPoolExecutor(max_workers=self.thread_pool_size) as executor:
                 futures = [
                     executor.submit(self.download, file, silence=silence)
                     for file in files_to_download
@@ -2006,30 +2494,32 @@ class S3LFS:
             tracker = metrics.get_tracker()
             tracker.start_pipeline()
 
-        # Phase 1: Resolve filesystem paths
+        # Phase 1: Resolve filesystem paths. The walk is lazy; paths are fed to the
+        # workers as they are found, so only the first match is needed up front.
         print("🔍 Resolving filesystem paths...")
-        files_to_track = self._resolve_filesystem_paths(path)
+        files_to_track = self._iter_filesystem_paths(path)
+        first_file = next(files_to_track, None)
 
-        if not files_to_track:
+        if first_file is None:
             print(f"⚠️ No files found to track for '{path}'.")
             if metrics.is_enabled():
                 tracker.end_pipeline()
             return
 
+        files_to_track = itertools.chain([first_file], files_to_track)
+
         # Test S3 credentials once before starting parallel operations
         if not silence:
             print("🔐 Testing S3 credentials...")
         self.test_s3_credentials(silence=silence)
 
-        print(
-            f"🚀 Processing {len(files_to_track)} files with interleaved hashing and uploading..."
-        )
+        print("🚀 Processing files with interleaved hashing and uploading...")
 
         # Start tracking stages
         if metrics.is_enabled():
-            tracker.start_stage("hashing", max_workers=DEFAULT_THREAD_POOL_SIZE)
-            tracker.start_stage("compression", max_workers=DEFAULT_THREAD_POOL_SIZE)
-            tracker.start_stage("s3_upload", max_workers=DEFAULT_THREAD_POOL_SIZE)
+            tracker.start_stage("hashing", max_workers=self.thread_pool_size)
+            tracker.start_stage("compression", max_workers=self.thread_pool_size)
+            tracker.start_stage("s3_upload", max_workers=self.thread_pool_size)
 
         # Phase 2: Process files with interleaved hashing and uploading
         files_uploaded = []
@@ -2039,7 +2529,7 @@ class S3LFS:
         try:
             # Create unified progress bars
             with tqdm(
-                total=len(files_to_track),
+                total=0,
                 desc="Files processed",
                 unit="file",
                 position=0,
@@ -2051,58 +2541,75 @@ class S3LFS:
                     """Callback to update the bytes progress bar"""
                     bytes_pbar.update(bytes_chunk)
 
-                with ThreadPoolExecutor(
-                    max_workers=DEFAULT_THREAD_POOL_SIZE
-                ) as executor:
-                    # Submit all hash-and-upload tasks
-                    future_to_file = {
-                        executor.submit(
-                            self._hash_and_upload_worker,
-                            str(file.as_posix()),
-                            True,
-                            progress_callback,
-                            use_cache,
-                        ): file
-                        for file in files_to_track
-                    }
-
-                    # Process results as they complete
-                    for future in as_completed(future_to_file):
-                        if self._shutdown_requested:
-                            print(
-                                "⚠️ Shutdown requested. Cancelling remaining operations..."
+                with ThreadPoolExecutor(max_workers=self.thread_pool_size) as executor:
+                    pending = set()
+
+                    def submit_next():
+                        """Submit the next path, if any. Returns False when exhausted."""
+                        file = next(files_to_track, None)
+                        if file is None:
+                            return False
+                        pending.add(
+                            executor.submit(
+                                self._hash_and_upload_worker,
+                                str(file.as_posix()),
+                                True,
+                                progress_callback,
+                                use_cache,
                             )
-                            return
-
-                        try:
-                            (
-                                file_path,
-                                file_hash,
-                                uploaded,
-                                bytes_transferred,
-                            ) = future.result()
-                            files_processed += 1
-                            total_bytes_transferred += bytes_transferred
+                        )
+                        file_pbar.total += 1
+                        file_pbar.refresh()
+                        return True
+
+                    # Keep a bounded number of hash-and-upload tasks queued so the
+                    # walk never runs far ahead of the workers
+                    queue_depth = max(DEFAULT_TRACK_QUEUE_DEPTH, self.thread_pool_size)
+                    while len(pending) < queue_depth and submit_next():
+                        pass
 
-                            if uploaded:
-                                files_uploaded.append((file_path, file_hash))
-                                # Update the bytes progress bar total for uploaded files
-                                bytes_pbar.total = (
-                                    bytes_pbar.total or 0
-                                ) + bytes_transferred
-                                bytes_pbar.refresh()
+                    # Process results as they complete, topping up the queue
+                    while pending:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            if self._shutdown_requested:
+                                print(
+                                    "⚠️ Shutdown requested. Cancelling remaining operations..."
+                                )
+                                return
+
+                            try:
+                                (
+                                    file_path,
+                                    file_hash,
+                                    uploaded,
+                                    bytes_transferred,
+                                ) = future.result()
+                                files_processed += 1
+                                total_bytes_transferred += bytes_transferred
+
+                                if uploaded:
+                                    files_uploaded.append((file_path, file_hash))
+                                    # Update the bytes progress bar total for uploaded files
+                                    bytes_pbar.total = (
+                                        bytes_pbar.total or 0
+                                    ) + bytes_transferred
+                                    bytes_pbar.refresh()
+
+                                file_pbar.update(1)
+                                file_pbar.set_postfix(
+                                    {
+                                        "uploaded": len(files_uploaded),
+                                        "skipped": files_processed
+                                        - len(files_uploaded),
+                                    }
+                                )
 
-                            file_pbar.update(1)
-                            file_pbar.set_postfix(
-                                {
-                                    "uploaded": len(files_uploaded),
-                                    "skipped": files_processed - len(files_uploaded),
-                                }
-                            )
+                            except Exception as e:
+                                print(f"An error occurred during processing: {e}")
+                                raise
 
-                        except Exception as e:
-                            print(f"An error occurred during processing: {e}")
-                            raise
+                            submit_next()
 
         except KeyboardInterrupt:
             print("\n⚠️ Processing interrupted by user.")
@@ -2164,9 +2671,9 @@ class S3LFS:
 
         # Start tracking stages
         if metrics.is_enabled():
-            tracker.start_stage("hashing", max_workers=DEFAULT_THREAD_POOL_SIZE)
-            tracker.start_stage("s3_download", max_workers=DEFAULT_THREAD_POOL_SIZE)
-            tracker.start_stage("decompression", max_workers=DEFAULT_THREAD_POOL_SIZE)
+            tracker.start_stage("hashing", max_workers=self.thread_pool_size)
+            tracker.start_stage("s3_download", max_workers=self.thread_pool_size)
+            tracker.start_stage("decompression", max_workers=self.thread_pool_size)
 
         # Phase 2: Start processing immediately - discover sizes during download
         # We'll process ALL files to ensure proper progress tracking, even for up-to-date ones
@@ -2207,9 +2714,7 @@ class S3LFS:
                         bytes_pbar.refresh()
                     bytes_pbar.update(bytes_chunk)
 
-                with ThreadPoolExecutor(
-                    max_workers=DEFAULT_THREAD_POOL_SIZE
-                ) as executor:
+                with ThreadPoolExecutor(max_workers=self.thread_pool_size) as executor:
                     # Submit hash-and-download tasks for all files (including up-to-date ones for progress tracking)
                     future_to_file = {
                         executor.submit(
@@ -2331,12 +2836,15 @@ class S3LFS:
         os.makedirs(base_directrory, exist_ok=True)
 
         target_paths = []
-        total_file_size = 0
 
-        # First pass: discover total size and notify progress callback
-        for idx, key in enumerate(keys):
-            obj = self._get_s3_client().head_object(Bucket=self.bucket_name, Key=key)
-            total_file_size += obj["ContentLength"]
+        # First pass: discover object sizes and notify progress callback
+        key_sizes = [
+            self._get_s3_client().head_object(Bucket=self.bucket_name, Key=key)[
+                "ContentLength"
+            ]
+            for key in keys
+        ]
+        total_file_size = sum(key_sizes)
 
         # Notify progress callback of total size discovery (for dynamic progress bar)
         if progress_callback:
@@ -2347,14 +2855,10 @@ class S3LFS:
                 # Fallback: callback doesn't support file_size parameter
                 pass
 
-        for idx, key in enumerate(keys):
+        for key, file_size in zip(keys, key_sizes):
             try:
                 target_path = self.temp_dir / f"{uuid4()}.gz"
                 target_paths.append(target_path)
-                obj = self._get_s3_client().head_object(
-                    Bucket=self.bucket_name, Key=key
-                )
-                file_size = obj["ContentLength"]
 
                 # Set up progress callback and context manager
                 if progress_callback:
@@ -2396,6 +2900,7 @@ class S3LFS:
                                     Key=key,
                                     Fileobj=f,
                                     Callback=download_callback,
+                                    Config=self.download_config,
                                 )
                     else:
                         with open(target_path, "wb") as f:
@@ -2404,6 +2909,7 @@ class S3LFS:
                                 Key=key,
                                 Fileobj=f,
                                 Callback=download_callback,
+                                Config=self.download_config,
                             )
             except Exception as e:
                 print(f"❌ Error downloading {key}: {e}")
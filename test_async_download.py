@@ -0,0 +1,172 @@
+import asyncio
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import boto3
+from click.testing import CliRunner
+from moto import mock_s3
+
+from s3lfs import S3LFS
+from s3lfs.cli import cli
+
+
+class _FakeBody:
+    """Minimal stand-in for aiobotocore's StreamingBody."""
+
+    def __init__(self, data):
+        self._buffer = io.BytesIO(data)
+
+    async def read(self, amt=-1):
+        return self._buffer.read(amt)
+
+    def close(self):
+        pass
+
+
+class _FakeAioClient:
+    """Async facade over a synchronous (moto-backed) boto3 client."""
+
+    def __init__(self, client):
+        self._client = client
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def list_objects_v2(self, **kwargs):
+        return self._client.list_objects_v2(**kwargs)
+
+    async def get_object(self, **kwargs):
+        response = self._client.get_object(**kwargs)
+        return {"Body": _FakeBody(response["Body"].read())}
+
+
+class _FakeAioSession:
+    def __init__(self, client):
+        self._client = client
+        self.create_client_calls = []
+
+    def create_client(self, service_name, config=None):
+        self.create_client_calls.append((service_name, config))
+        return _FakeAioClient(self._client)
+
+
+@mock_s3
+class TestAsyncDownload(unittest.TestCase):
+    def setUp(self):
+        self.original_cwd = os.getcwd()
+        self.test_dir = tempfile.mkdtemp()
+        os.chdir(self.test_dir)
+        os.makedirs(".git")
+
+        self.bucket_name = "testbucket"
+        self.s3 = boto3.client("s3")
+        self.s3.create_bucket(Bucket=self.bucket_name)
+
+        self.versioner = S3LFS(
+            bucket_name=self.bucket_name, manifest_file=".s3_manifest.json"
+        )
+
+        os.makedirs("data")
+        self.files = {
+            "data/a.txt": "first file contents",
+            "data/b.txt": "second file contents",
+        }
+        for path, content in self.files.items():
+            with open(path, "w") as f:
+                f.write(content)
+
+    def tearDown(self):
+        os.chdir(self.original_cwd)
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def _upload_and_delete_local(self):
+        for path in self.files:
+            self.versioner.upload(path, silence=True)
+            os.remove(path)
+
+    def _assert_restored(self):
+        for path, content in self.files.items():
+            self.assertEqual(Path(path).read_text(), content)
+
+    def test_async_download_without_aiobotocore(self):
+        """Falls back to running the synchronous download on worker threads."""
+        self._upload_and_delete_local()
+
+        with patch("s3lfs.core.get_aio_session", None):
+            asyncio.run(self.versioner.parallel_download_all_async(concurrency=2))
+
+        self._assert_restored()
+
+    def test_async_download_with_aio_client(self):
+        """Uses one shared async client when aiobotocore is available."""
+        self._upload_and_delete_local()
+        session = _FakeAioSession(self.s3)
+
+        with patch("s3lfs.core.get_aio_session", return_value=session), patch(
+            "s3lfs.core.AioConfig", MagicMock()
+        ) as mock_config:
+            asyncio.run(self.versioner.parallel_download_all_async(concurrency=4))
+
+        self.assertEqual(len(session.create_client_calls), 1)
+        mock_config.assert_called_once_with(max_pool_connections=4)
+        self._assert_restored()
+
+    def test_async_download_chunked_file(self):
+        """Chunked objects are reassembled in order by the async path."""
+        self.versioner.chunk_size = 8
+        self._upload_and_delete_local()
+        session = _FakeAioSession(self.s3)
+
+        with patch("s3lfs.core.get_aio_session", return_value=session), patch(
+            "s3lfs.core.AioConfig", MagicMock()
+        ):
+            asyncio.run(self.versioner.parallel_download_all_async())
+
+        self._assert_restored()
+
+    def test_async_download_skips_up_to_date_files(self):
+        for path in self.files:
+            self.versioner.upload(path, silence=True)
+        session = _FakeAioSession(self.s3)
+
+        with patch("s3lfs.core.get_aio_session", return_value=session), patch(
+            "s3lfs.core.AioConfig", MagicMock()
+        ), patch.object(self.versioner, "decompress_file") as mock_decompress:
+            asyncio.run(self.versioner.parallel_download_all_async())
+
+        mock_decompress.assert_not_called()
+        self._assert_restored()
+
+    def test_async_download_empty_manifest(self):
+        with patch("builtins.print") as mock_print:
+            asyncio.run(self.versioner.parallel_download_all_async())
+        mock_print.assert_any_call("⚠️ Manifest is empty. Nothing to download.")
+
+    def test_cli_checkout_all_async(self):
+        """`checkout --all --async` dispatches to the asyncio driver."""
+        runner = CliRunner()
+        mock_versioner = MagicMock()
+
+        async def fake_download_all(silence=True):
+            return None
+
+        mock_versioner.parallel_download_all_async.side_effect = fake_download_all
+
+        with patch("s3lfs.cli._make_s3lfs", return_value=mock_versioner):
+            result = runner.invoke(cli, ["checkout", "--all", "--async"])
+
+        self.assertEqual(result.exit_code, 0, result.output)
+        mock_versioner.parallel_download_all_async.assert_called_once_with(silence=True)
+        mock_versioner.parallel_download_all.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,15 +5,17 @@ Tests various error paths, edge cases, and the migrate command.
 
 import json
 import os
+import subprocess
+import sys
 import tempfile
 import unittest
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import yaml
 from click.testing import CliRunner
 
-from s3lfs.cli import cli, find_git_root, get_manifest_path, migrate
+from s3lfs.cli import ByteSize, cli, find_git_root, get_manifest_path, migrate
 
 
 class TestCLICoverage(unittest.TestCase):
@@ -400,6 +402,31 @@ class TestCLICoverage(unittest.TestCase):
         self.assertNotEqual(result.exit_code, 0)
         self.assertIn("S3LFS not initialized", result.output)
 
+    def test_remove_dispatches_on_manifest_entries(self):
+        """remove picks remove_file/remove_subtree from the manifest alone."""
+        (self.test_path / ".s3_manifest.yaml").write_text("files: {}\n")
+        mock_versioner = MagicMock()
+        mock_versioner.manifest = {"files": {"missing.txt": "hash", "dir/a.txt": "h"}}
+
+        with patch("s3lfs.cli._make_s3lfs", return_value=mock_versioner), patch(
+            "pathlib.Path.is_file"
+        ) as mock_is_file:
+            # Tracked but not checked out: still a single-file removal
+            result = self.runner.invoke(cli, ["remove", "missing.txt"])
+            self.assertEqual(result.exit_code, 0, result.output)
+            mock_versioner.remove_file.assert_called_once_with(
+                "missing.txt", keep_in_s3=True, dry_run=False
+            )
+
+            for path in ("dir", "dir/*.txt"):
+                result = self.runner.invoke(cli, ["remove", path, "--purge-from-s3"])
+                self.assertEqual(result.exit_code, 0, result.output)
+                mock_versioner.remove_subtree.assert_called_with(
+                    path, keep_in_s3=False, dry_run=False
+                )
+
+        mock_is_file.assert_not_called()
+
     def test_cleanup_command_not_in_git_repo(self):
         """Test cleanup command when not in a git repository."""
         import shutil
@@ -553,6 +580,205 @@ class TestCLICoverage(unittest.TestCase):
             # Should succeed - the exception is caught
             self.assertEqual(result.exit_code, 0)
 
+    def test_cli_import_does_not_load_boto3(self):
+        """Importing the CLI module should not pull in s3lfs.core/boto3/asyncio."""
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, s3lfs.cli; "
+                "print('boto3' in sys.modules, 's3lfs.core' in sys.modules, "
+                "'asyncio' in sys.modules)",
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        self.assertEqual(result.stdout.strip(), "False False False")
+
+    def test_commands_registered_once(self):
+        """Every command in COMMANDS is registered under its own name."""
+        from s3lfs.cli import COMMANDS
+
+        names = [command.name for command in COMMANDS]
+        self.assertEqual(len(names), len(set(names)))
+        self.assertEqual(sorted(cli.commands), sorted(names))
+        for command in COMMANDS:
+            self.assertIs(cli.commands[command.name], command)
+
+    def test_byte_size_param_type(self):
+        """ByteSize accepts plain byte counts and binary unit suffixes."""
+        size = ByteSize()
+        self.assertEqual(size.convert("1048576", None, None), 1048576)
+        self.assertEqual(size.convert("16MB", None, None), 16 * 1024 * 1024)
+        self.assertEqual(size.convert("64MiB", None, None), 64 * 1024 * 1024)
+        self.assertEqual(size.convert("2k", None, None), 2048)
+        self.assertEqual(size.convert("1G", None, None), 1024**3)
+        self.assertEqual(size.convert(512, None, None), 512)
+
+    def test_byte_size_param_type_invalid(self):
+        """Invalid sizes are reported as usage errors."""
+        result = self.runner.invoke(
+            cli, ["track", "file.txt", "--multipart-chunksize", "lots"]
+        )
+        self.assertEqual(result.exit_code, 2)
+        self.assertIn("'lots' is not a valid size", result.output)
+
+    def test_transfer_options_passed_to_s3lfs(self):
+        """--max-concurrency/--multipart-chunksize reach the S3LFS constructor."""
+        (self.test_path / ".s3_manifest.yaml").write_text("files: {}\n")
+        (self.test_path / "file.txt").write_text("content")
+
+        for command in (["track", "file.txt"], ["checkout", "file.txt"]):
+            with patch("s3lfs.cli._make_s3lfs", return_value=MagicMock()) as mock_make:
+                result = self.runner.invoke(
+                    cli,
+                    command
+                    + ["--max-concurrency", "4", "--multipart-chunksize", "32MB"]
+                    + ["--concurrency", "16"],
+                )
+
+            self.assertEqual(result.exit_code, 0, result.output)
+            kwargs = mock_make.call_args.kwargs
+            self.assertEqual(kwargs["thread_pool_size"], 16)
+            self.assertEqual(kwargs["max_concurrency"], 4)
+            self.assertEqual(kwargs["multipart_chunksize"], 32 * 1024 * 1024)
+
+    def test_transfer_options_omitted_use_core_defaults(self):
+        """Without the options, S3LFS falls back to its own defaults."""
+        (self.test_path / ".s3_manifest.yaml").write_text("files: {}\n")
+
+        with patch("s3lfs.cli._make_s3lfs", return_value=MagicMock()) as mock_make:
+            result = self.runner.invoke(cli, ["checkout", "--all"])
+
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertNotIn("max_concurrency", mock_make.call_args.kwargs)
+        self.assertNotIn("multipart_chunksize", mock_make.call_args.kwargs)
+        self.assertNotIn("thread_pool_size", mock_make.call_args.kwargs)
+
+    def test_track_modified_git_fastpath_flag(self):
+        """track --modified uses the git fast path unless --no-git-fastpath is set."""
+        (self.test_path / ".s3_manifest.yaml").write_text("files: {}\n")
+
+        for extra_args, expected in (([], True), (["--no-git-fastpath"], False)):
+            mock_versioner = MagicMock()
+            with patch("s3lfs.cli._make_s3lfs", return_value=mock_versioner):
+                result = self.runner.invoke(cli, ["track", "--modified"] + extra_args)
+
+            self.assertEqual(result.exit_code, 0, result.output)
+            mock_versioner.track_modified_files_cached.assert_called_once_with(
+                silence=True, git_fastpath=expected, dry_run=False
+            )
+
+    def test_cleanup_with_inventory(self):
+        """cleanup --inventory feeds inventory keys to cleanup_s3."""
+        (self.test_path / ".s3_manifest.yaml").write_text("files: {}\n")
+        mock_versioner = MagicMock()
+        mock_versioner.iter_inventory_keys.return_value = iter(["a", "b"])
+
+        with patch("s3lfs.cli._make_s3lfs", return_value=mock_versioner):
+            result = self.runner.invoke(
+                cli,
+                ["cleanup", "--force", "--inventory", "s3://inv/manifest.json"],
+            )
+
+        self.assertEqual(result.exit_code, 0, result.output)
+        mock_versioner.iter_inventory_keys.assert_called_once_with(
+            "s3://inv/manifest.json"
+        )
+        mock_versioner.cleanup_s3.assert_called_once_with(
+            force=True,
+            keys_iter=mock_versioner.iter_inventory_keys.return_value,
+            dry_run=False,
+        )
+
+    def test_dry_run_flag(self):
+        """--dry-run is passed through by track, remove and cleanup."""
+        (self.test_path / ".s3_manifest.yaml").write_text("files: {}\n")
+        mock_versioner = MagicMock()
+        mock_versioner.manifest = {"files": {"a.txt": "hash"}}
+
+        with patch("s3lfs.cli._make_s3lfs", return_value=mock_versioner):
+            for args in (
+                ["track", "a.txt", "--dry-run"],
+                ["track", "--modified", "--dry-run"],
+                ["remove", "a.txt", "--dry-run"],
+                ["remove", "dir", "--dry-run"],
+                ["cleanup", "--dry-run"],
+            ):
+                result = self.runner.invoke(cli, args)
+                self.assertEqual(result.exit_code, 0, result.output)
+
+        for method in (
+            mock_versioner.track,
+            mock_versioner.track_modified_files_cached,
+            mock_versioner.remove_file,
+            mock_versioner.remove_subtree,
+            mock_versioner.cleanup_s3,
+        ):
+            self.assertTrue(method.call_args.kwargs["dry_run"])
+
+    def test_local_hash_option(self):
+        """--local-hash reaches the S3LFS constructor and defaults to sha256."""
+        (self.test_path / ".s3_manifest.yaml").write_text("files: {}\n")
+
+        for extra_args, expected in (
+            ([], "sha256"),
+            (["--local-hash", "blake3"], "blake3"),
+        ):
+            with patch("s3lfs.cli._make_s3lfs", return_value=MagicMock()) as mock_make:
+                result = self.runner.invoke(cli, ["track", "--modified"] + extra_args)
+
+            self.assertEqual(result.exit_code, 0, result.output)
+            self.assertEqual(mock_make.call_args.kwargs["local_hash"], expected)
+
+    def test_s3lfs_instance_shared_through_context_obj(self):
+        """In-process callers sharing ctx.obj reuse one S3LFS per configuration."""
+        (self.test_path / ".s3_manifest.yaml").write_text("files: {}\n")
+        mock_class = MagicMock()
+        shared = {}
+
+        with patch("s3lfs.cli._get_s3lfs_class", return_value=mock_class):
+            for args in (["ls"], ["checkout", "--all"], ["ls"]):
+                cli.main(args, obj=shared, standalone_mode=False)
+            # A different configuration gets its own instance
+            cli.main(["ls", "--no-sign-request"], obj=shared, standalone_mode=False)
+
+        self.assertEqual(mock_class.call_count, 3)
+        self.assertEqual(len(shared["s3lfs"]), 3)
+        mock_class.return_value.load_manifest.assert_called()
+
+    def test_environment_variable_defaults(self):
+        """S3LFS_* environment variables stand in for the matching options."""
+        (self.test_path / ".s3_manifest.yaml").write_text("files: {}\n")
+        env = {
+            "S3LFS_NO_SIGN_REQUEST": "1",
+            "S3LFS_MANIFEST_CACHE": str(self.test_path / "manifest.pkl"),
+        }
+
+        for command in (["checkout", "--all"], ["ls"]):
+            with patch("s3lfs.cli._make_s3lfs", return_value=MagicMock()) as mock_make:
+                result = self.runner.invoke(cli, command, env=env)
+
+            self.assertEqual(result.exit_code, 0, result.output)
+            kwargs = mock_make.call_args.kwargs
+            self.assertTrue(kwargs["no_sign_request"])
+            self.assertEqual(kwargs["manifest_cache"], env["S3LFS_MANIFEST_CACHE"])
+
+    def test_init_bucket_and_prefix_from_environment(self):
+        """init reads BUCKET and PREFIX from S3LFS_BUCKET/S3LFS_PREFIX."""
+        with patch("s3lfs.cli._make_s3lfs", return_value=MagicMock()) as mock_make:
+            result = self.runner.invoke(
+                cli,
+                ["init"],
+                env={"S3LFS_BUCKET": "env-bucket", "S3LFS_PREFIX": "env-prefix"},
+            )
+
+        self.assertEqual(result.exit_code, 0, result.output)
+        kwargs = mock_make.call_args.kwargs
+        self.assertEqual(kwargs["bucket_name"], "env-bucket")
+        self.assertEqual(kwargs["repo_prefix"], "env-prefix")
+
 
 # Note: Lines 205-206 and 265-266 in cli.py (ValueError exception handlers for relative_to)
 # are defensive error handling that's difficult to test in isolated unit tests without
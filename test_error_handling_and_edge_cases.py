@@ -844,16 +844,15 @@ class TestS3LFSErrorHandlingAndEdgeCases(unittest.TestCase):
             if compressed_file.exists():
                 compressed_file.unlink()
 
-    def test_hash_file_auto_selection_linux_cli(self):
-        """Test automatic selection of CLI method on Linux for non-empty files."""
+    def test_hash_file_auto_selection_in_process(self):
+        """Test that auto hashing stays in-process even when sha256sum exists."""
         with patch("sys.platform", "linux"), patch(
             "shutil.which", return_value="/usr/bin/sha256sum"
         ), patch("subprocess.run") as mock_run:
-            mock_run.return_value.stdout = "abc123def456 /path/to/file\n"
-
-            # Should select CLI method for non-empty files on Linux
             result = self.versioner.hash_file(self.test_file, method="auto")
-            self.assertEqual(result, "abc123def456")
+
+        mock_run.assert_not_called()
+        self.assertEqual(result, self.versioner.hash_file(self.test_file, "cli"))
 
     def test_md5_file_auto_selection_linux(self):
         """Test MD5 auto selection on Linux."""
@@ -5,6 +5,7 @@ import shutil
 import signal
 import subprocess
 import sys
+import tempfile
 import time
 import unittest
 from concurrent.futures import CancelledError
@@ -16,7 +17,7 @@ import yaml
 from botocore.exceptions import ClientError
 from moto import mock_s3
 
-from s3lfs import S3LFS
+from s3lfs import S3LFS, core
 
 
 @mock_s3
@@ -283,9 +284,87 @@ class TestS3LFS(unittest.TestCase):
             # Reset chunk size to default
             self.versioner.chunk_size = chunk_size
 
+    def test_cleanup_s3_from_inventory(self):
+        """Cleanup can take its key listing from an S3 Inventory report."""
+        import gzip
+
+        self.versioner.upload(self.test_file)
+        self.versioner.upload(self.another_test_file)
+        stale_hash = self.versioner.hash_file(self.test_file)
+        stale_key = f"s3lfs/assets/{stale_hash}/{self.test_file}.gz"
+        del self.versioner.manifest["files"][self.test_file]
+        self.versioner.save_manifest()
+
+        # Inventory keys are URL-encoded; include a row for another bucket too
+        rows = [
+            f'"{self.bucket_name}","{stale_key.replace("/", "%2F")}","10"',
+            f'"other-bucket","{stale_key}","10"',
+        ]
+        self.s3.put_object(
+            Bucket=self.bucket_name,
+            Key="inventory/data/part-0.csv.gz",
+            Body=gzip.compress("\n".join(rows).encode()),
+        )
+        self.s3.put_object(
+            Bucket=self.bucket_name,
+            Key="inventory/manifest.json",
+            Body=json.dumps(
+                {
+                    "fileFormat": "CSV",
+                    "fileSchema": "Bucket, Key, Size",
+                    "files": [{"key": "inventory/data/part-0.csv.gz"}],
+                }
+            ),
+        )
+
+        keys = list(
+            self.versioner.iter_inventory_keys(
+                f"s3://{self.bucket_name}/inventory/manifest.json"
+            )
+        )
+        self.assertEqual(keys, [stale_key])
+
+        with patch.object(self.versioner, "_iter_asset_keys") as mock_list:
+            self.versioner.cleanup_s3(force=True, keys_iter=keys)
+        mock_list.assert_not_called()
+
+        response = self.s3.list_objects_v2(Bucket=self.bucket_name, Prefix="s3lfs/")
+        remaining = [obj["Key"] for obj in response.get("Contents", [])]
+        self.assertNotIn(stale_key, remaining)
+        self.assertEqual(len(remaining), 1)
+
+    def test_iter_inventory_keys_rejects_bad_input(self):
+        """Only s3:// URLs pointing at CSV inventories are accepted."""
+        with self.assertRaises(ValueError):
+            list(self.versioner.iter_inventory_keys("inventory/manifest.json"))
+
+        self.s3.put_object(
+            Bucket=self.bucket_name,
+            Key="inventory/manifest.json",
+            Body=json.dumps({"fileFormat": "Parquet", "files": []}),
+        )
+        with self.assertRaises(ValueError):
+            list(
+                self.versioner.iter_inventory_keys(
+                    f"s3://{self.bucket_name}/inventory/manifest.json"
+                )
+            )
+
     # -------------------------------------------------
     # 6. Parallel Upload/Download
     # -------------------------------------------------
+    def test_parallel_download_all_uses_thread_pool_size(self):
+        """The file-level worker pool is sized by thread_pool_size."""
+        self.versioner.upload(self.test_file)
+        self.versioner.thread_pool_size = 3
+
+        with patch(
+            "s3lfs.core.ThreadPoolExecutor", wraps=core.ThreadPoolExecutor
+        ) as mock_executor:
+            self.versioner.parallel_download_all()
+
+        mock_executor.assert_called_once_with(max_workers=3)
+
     def test_parallel_upload(self):
         files = [self.test_file, self.another_test_file]
         self.versioner.parallel_upload(files)
@@ -340,6 +419,36 @@ class TestS3LFS(unittest.TestCase):
             self.versioner.download(self.test_file)
             mock_s3.download_file.assert_not_called()  # Ensure no new S3 download happened
 
+    @unittest.skipIf(core.blake3 is None, "blake3 is not installed")
+    def test_blake3_local_hash_skips_sha256_for_touched_files(self):
+        """A touched but unchanged file reuses its cached SHA-256 via BLAKE3."""
+        versioner = S3LFS(bucket_name=self.bucket_name, local_hash="blake3")
+        sha256 = versioner.hash_file_cached(self.test_file)
+        self.assertIn("blake3", versioner.hash_cache[self.test_file])
+
+        # New mtime, same content: BLAKE3 matches, so no SHA-256 pass
+        stat = os.stat(self.test_file)
+        os.utime(self.test_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        with patch.object(versioner, "hash_file") as mock_hash_file:
+            self.assertEqual(versioner.hash_file_cached(self.test_file), sha256)
+        mock_hash_file.assert_not_called()
+
+        # New content: falls through to SHA-256
+        with open(self.test_file, "a") as f:
+            f.write(" changed")
+        self.assertEqual(
+            versioner.hash_file_cached(self.test_file),
+            versioner.hash_file(self.test_file),
+        )
+
+    def test_local_hash_validation(self):
+        """Unknown local hashes and a missing blake3 package are rejected."""
+        with self.assertRaises(ValueError):
+            S3LFS(bucket_name=self.bucket_name, local_hash="md5")
+        with patch("s3lfs.core.blake3", None):
+            with self.assertRaises(RuntimeError):
+                S3LFS(bucket_name=self.bucket_name, local_hash="blake3")
+
     # -------------------------------------------------
     # 9. Compression Before Upload
     # -------------------------------------------------
@@ -436,6 +545,28 @@ class TestS3LFS(unittest.TestCase):
         response = self.s3.list_objects_v2(Bucket=self.bucket_name, Prefix=s3_key)
         self.assertFalse("Contents" in response)
 
+    def test_remove_subtree_purges_chunked_objects(self):
+        """Purging a chunked file deletes its chunk objects, not just '<key>.gz'."""
+        chunk_size = self.versioner.chunk_size
+        self.versioner.chunk_size = 4
+        try:
+            self.versioner.upload(self.test_file)
+            self.versioner.upload(self.another_test_file)
+        finally:
+            self.versioner.chunk_size = chunk_size
+        file_hash = self.versioner.hash_file(self.test_file)
+        prefix = f"s3lfs/assets/{file_hash}/"
+        response = self.s3.list_objects_v2(Bucket=self.bucket_name, Prefix=prefix)
+        self.assertGreater(len(response["Contents"]), 1)
+
+        self.versioner.remove_subtree(self.test_directory, keep_in_s3=False)
+
+        response = self.s3.list_objects_v2(Bucket=self.bucket_name, Prefix=prefix)
+        self.assertNotIn("Contents", response)
+        # Files outside the subtree keep their objects
+        response = self.s3.list_objects_v2(Bucket=self.bucket_name, Prefix="s3lfs/")
+        self.assertGreater(len(response["Contents"]), 0)
+
     def test_remove_subtree_updates_manifest(self):
         os.makedirs("test_dir", exist_ok=True)
         file_path = "test_dir/nested_file.txt"
@@ -461,6 +592,45 @@ class TestS3LFS(unittest.TestCase):
         os.remove(file_path)
         shutil.rmtree("test_dir")
 
+    def test_dry_run_makes_no_s3_calls(self):
+        """Dry runs of track and remove never touch S3 or the manifest."""
+        self.versioner.upload(self.test_file)
+        manifest_before = dict(self.versioner.manifest["files"])
+
+        with open(self.test_file, "w") as f:
+            f.write("Changed content.")
+
+        with patch.object(
+            self.versioner, "_get_s3_client", side_effect=AssertionError("S3 call")
+        ), patch("builtins.print") as mock_print:
+            self.versioner.track(self.test_directory, dry_run=True)
+            self.versioner.track(self.another_test_file, dry_run=True)
+            self.versioner.track_modified_files_cached(dry_run=True)
+            self.versioner.remove_file(self.test_file, keep_in_s3=False, dry_run=True)
+            self.versioner.remove_subtree(
+                self.test_directory, keep_in_s3=False, dry_run=True
+            )
+
+        mock_print.assert_any_call(f"🔎 Would upload: {self.test_file}")
+        mock_print.assert_any_call(f"🔎 Would upload: {self.another_test_file}")
+        mock_print.assert_any_call(
+            f"🔎 Would untrack and purge from S3: {self.test_file}"
+        )
+        self.assertEqual(self.versioner.manifest["files"], manifest_before)
+
+    def test_cleanup_s3_dry_run(self):
+        """A cleanup dry run lists unreferenced objects but deletes nothing."""
+        self.versioner.upload(self.test_file)
+        del self.versioner.manifest["files"][self.test_file]
+        self.versioner.save_manifest()
+
+        with patch("builtins.input") as mock_input:
+            self.versioner.cleanup_s3(dry_run=True)
+
+        mock_input.assert_not_called()
+        response = self.s3.list_objects_v2(Bucket=self.bucket_name, Prefix="s3lfs/")
+        self.assertEqual(len(response["Contents"]), 1)
+
     def test_no_sign_request_upload(self):
         """Test uploading a file with no-sign-request enabled."""
         self.versioner.upload(self.test_file)
@@ -823,6 +993,47 @@ class TestS3LFS(unittest.TestCase):
             self.versioner._glob_match("data/subdir/test.log", "data/*.log")
         )
 
+    def test_iter_filesystem_paths_is_lazy(self):
+        """Directory walks are streamed and skip symlinked directories."""
+        os.makedirs("test_glob/subdir", exist_ok=True)
+        for fname in ("test_glob/a.txt", "test_glob/subdir/b.txt"):
+            with open(fname, "w") as f:
+                f.write(fname)
+        os.symlink(os.path.abspath("test_glob/subdir"), "test_glob/link")
+
+        try:
+            paths = self.versioner._iter_filesystem_paths("test_glob")
+            self.assertFalse(isinstance(paths, list))
+            self.assertEqual(
+                sorted(paths),
+                sorted(
+                    [
+                        Path("test_glob/a.txt").resolve(),
+                        Path("test_glob/subdir/b.txt").resolve(),
+                    ]
+                ),
+            )
+        finally:
+            shutil.rmtree("test_glob", ignore_errors=True)
+
+    def test_track_interleaved_bounded_queue(self):
+        """Tracking more files than the queue depth still uploads every file."""
+        os.makedirs("test_glob", exist_ok=True)
+        for i in range(7):
+            with open(f"test_glob/file{i}.txt", "w") as f:
+                f.write(f"content {i}")
+
+        try:
+            with patch("s3lfs.core.DEFAULT_TRACK_QUEUE_DEPTH", 2):
+                self.versioner.track_interleaved("test_glob")
+
+            self.assertEqual(
+                sorted(self.versioner.manifest["files"]),
+                [f"test_glob/file{i}.txt" for i in range(7)],
+            )
+        finally:
+            shutil.rmtree("test_glob", ignore_errors=True)
+
     def test_resolve_filesystem_paths_helper(self):
         """Test the _resolve_filesystem_paths helper function."""
         # Create test files
@@ -2461,6 +2672,61 @@ class TestS3LFS(unittest.TestCase):
             if manifest_file.exists():
                 manifest_file.unlink()
 
+    def test_manifest_cache_reused_while_unchanged(self):
+        """A pickled manifest is reused until the manifest file changes."""
+        manifest_file = Path(".test_manifest.yaml")
+        manifest_file.write_text(
+            yaml.safe_dump({"bucket_name": self.bucket_name, "files": {"a.txt": "h1"}})
+        )
+        cache_dir = Path(tempfile.mkdtemp())
+        cache_path = cache_dir / "manifest.pkl"
+
+        try:
+            versioner = S3LFS(
+                manifest_file=str(manifest_file), manifest_cache=str(cache_path)
+            )
+            self.assertTrue(cache_path.exists())
+            self.assertEqual(versioner.manifest["files"], {"a.txt": "h1"})
+
+            # A second load must come from the pickle, not the YAML parser
+            with patch("s3lfs.core.yaml.safe_load") as mock_safe_load:
+                versioner.load_manifest()
+            mock_safe_load.assert_not_called()
+            self.assertEqual(versioner.manifest["files"], {"a.txt": "h1"})
+
+            # Rewriting the manifest behind our back invalidates the cached copy
+            manifest_file.write_text(
+                yaml.safe_dump(
+                    {"bucket_name": self.bucket_name, "files": {"b.txt": "h22"}}
+                )
+            )
+            versioner.load_manifest()
+            self.assertEqual(versioner.manifest["files"], {"b.txt": "h22"})
+        finally:
+            manifest_file.unlink(missing_ok=True)
+            shutil.rmtree(cache_dir, ignore_errors=True)
+
+    def test_manifest_cache_ignores_corrupt_pickle(self):
+        """An unreadable manifest cache falls back to parsing the manifest."""
+        manifest_file = Path(".test_manifest.json")
+        manifest_file.write_text(
+            json.dumps({"bucket_name": self.bucket_name, "files": {"a.txt": "h1"}})
+        )
+        cache_dir = Path(tempfile.mkdtemp())
+        cache_path = cache_dir / "manifest.pkl"
+        cache_path.write_bytes(b"not a pickle")
+
+        try:
+            with patch.dict(os.environ, {"S3LFS_MANIFEST_CACHE": str(cache_path)}):
+                versioner = S3LFS(manifest_file=str(manifest_file))
+
+            self.assertEqual(versioner.manifest_cache, cache_path)
+            self.assertEqual(versioner.manifest["files"], {"a.txt": "h1"})
+            self.assertNotEqual(cache_path.read_bytes(), b"not a pickle")
+        finally:
+            manifest_file.unlink(missing_ok=True)
+            shutil.rmtree(cache_dir, ignore_errors=True)
+
     def test_split_file_basic(self):
         """Test split_file basic functionality."""
         # Create a larger file
@@ -3403,6 +3669,52 @@ class TestS3LFS(unittest.TestCase):
             # Should have called parallel_upload due to detected changes
             self.assertTrue(mock_upload.called)
 
+    def test_track_modified_files_cached_git_fastpath(self):
+        """Files git reports as unchanged since HEAD are not re-hashed."""
+        original_cwd = os.getcwd()
+        repo_dir = tempfile.mkdtemp()
+        try:
+            os.chdir(repo_dir)
+            git = ["git", "-c", "user.name=test", "-c", "user.email=test@example.com"]
+            subprocess.run(git + ["init", "-q"], check=True)
+            for name in ("committed.txt", "edited.txt", "untracked.txt"):
+                Path(name).write_text(name)
+            subprocess.run(git + ["add", "committed.txt", "edited.txt"], check=True)
+            subprocess.run(git + ["commit", "-q", "-m", "init"], check=True)
+            Path("edited.txt").write_text("edited")
+
+            versioner = S3LFS(bucket_name=self.bucket_name)
+            versioner.manifest["files"] = {
+                "committed.txt": "h1",
+                "edited.txt": "h2",
+                "untracked.txt": "h3",
+            }
+
+            with patch.object(versioner, "track_paths") as mock_track_paths:
+                versioner.track_modified_files_cached(git_fastpath=True)
+            self.assertEqual(
+                mock_track_paths.call_args.args[0], ["edited.txt", "untracked.txt"]
+            )
+
+            # Without the fast path every manifest entry is checked
+            with patch.object(versioner, "track_paths") as mock_track_paths:
+                versioner.track_modified_files_cached()
+            self.assertEqual(
+                mock_track_paths.call_args.args[0],
+                ["committed.txt", "edited.txt", "untracked.txt"],
+            )
+        finally:
+            os.chdir(original_cwd)
+            shutil.rmtree(repo_dir, ignore_errors=True)
+
+    def test_git_unmodified_files_without_git(self):
+        """The git fast path is disabled when git cannot answer."""
+        with patch(
+            "s3lfs.core.subprocess.run",
+            side_effect=subprocess.CalledProcessError(128, "git"),
+        ):
+            self.assertIsNone(self.versioner._git_unmodified_files())
+
     def test_hash_cache_performance_comparison(self):
         """Test that cached hashing is faster than regular hashing."""
         import time
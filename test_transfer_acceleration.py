@@ -80,20 +80,10 @@ class TestTransferAcceleration(unittest.TestCase):
             mock_boto3_client.assert_called_once()
             call_args = mock_boto3_client.call_args
 
-            # Check that the config does not include use_accelerate_endpoint
-            # When no config is passed, boto3.client is called without config parameter
+            # Check that the config does not enable use_accelerate_endpoint
             if "config" in call_args[1]:
                 config = call_args[1]["config"]
-                self.assertFalse(
-                    hasattr(config, "s3")
-                    or (
-                        hasattr(config, "s3")
-                        and "use_accelerate_endpoint" not in config.s3
-                    )
-                )
-            else:
-                # No config passed, which is correct for disabled acceleration
-                pass
+                self.assertFalse((config.s3 or {}).get("use_accelerate_endpoint"))
 
     def test_transfer_acceleration_with_unsigned_requests_fails(self):
         """Test that transfer acceleration fails with unsigned requests."""
@@ -210,6 +200,64 @@ class TestTransferAcceleration(unittest.TestCase):
 
         self.assertFalse(s3lfs_no_accel.use_acceleration)
 
+    def test_transfer_config_defaults(self):
+        """Test that multipart tuning defaults are applied to the TransferConfig."""
+        from s3lfs.core import DEFAULT_MAX_CONCURRENCY, DEFAULT_MULTIPART_CHUNKSIZE
+
+        s3lfs = S3LFS(bucket_name="test-bucket", repo_prefix="test-prefix")
+
+        self.assertEqual(s3lfs.config.max_concurrency, DEFAULT_MAX_CONCURRENCY)
+        self.assertEqual(s3lfs.config.multipart_chunksize, DEFAULT_MULTIPART_CHUNKSIZE)
+
+    def test_transfer_config_custom_values(self):
+        """Test that max_concurrency/multipart_chunksize reach the TransferConfig."""
+        for no_sign_request in (False, True):
+            s3lfs = S3LFS(
+                bucket_name="test-bucket",
+                repo_prefix="test-prefix",
+                no_sign_request=no_sign_request,
+                max_concurrency=4,
+                multipart_chunksize=64 * 1024 * 1024,
+            )
+
+            self.assertEqual(s3lfs.config.max_concurrency, 4)
+            self.assertEqual(s3lfs.config.multipart_chunksize, 64 * 1024 * 1024)
+            self.assertEqual(s3lfs.download_config.max_concurrency, 4)
+            self.assertEqual(
+                s3lfs.download_config.multipart_chunksize, 64 * 1024 * 1024
+            )
+
+    def test_client_pool_sized_for_max_concurrency(self):
+        """Default clients get enough connections for max_concurrency parts."""
+        with patch("boto3.client") as mock_boto3_client:
+            for kwargs in ({}, {"no_sign_request": True}, {"use_acceleration": True}):
+                s3lfs = S3LFS(
+                    bucket_name="test-bucket",
+                    repo_prefix="test-prefix",
+                    max_concurrency=32,
+                    **kwargs,
+                )
+                s3lfs.s3_factory(s3lfs.no_sign_request)
+
+                config = mock_boto3_client.call_args[1]["config"]
+                self.assertEqual(config.max_pool_connections, 32)
+
+    def test_unsigned_downloads_use_ranged_gets(self):
+        """Unsigned requests keep multipart downloads (parallel ranged GETs)."""
+        from boto3.s3.transfer import TransferConfig
+
+        s3lfs = S3LFS(
+            bucket_name="test-bucket", repo_prefix="test-prefix", no_sign_request=True
+        )
+
+        self.assertEqual(
+            s3lfs.download_config.multipart_threshold,
+            TransferConfig().multipart_threshold,
+        )
+        self.assertGreater(
+            s3lfs.config.multipart_threshold, s3lfs.download_config.multipart_threshold
+        )
+
 
 if __name__ == "__main__":
     unittest.main()